@@ -4,21 +4,71 @@ Selenium browser automation adapter.
 Provides a shared Selenium WebDriver service for web scraping operations.
 """
 
+import functools
+import os
+import shutil
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Any, Final, List, Literal, Mapping, Optional, Tuple, Union
 
 from selenium import webdriver
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
 from src.core.ports.config import Config
 from src.core.ports.logger import Logger
-from src.core.ports.browser import By
+from src.core.ports.browser import Locator
+
+# Chrome arguments that do not depend on configuration
+CHROME_ARGS: Final[Tuple[str, ...]] = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-features=Translate",
+    "--blink-settings=imagesEnabled=false",
+)
+
+# Executable name of the automation-only headless Chrome build
+HEADLESS_SHELL_NAME: Final[str] = "chrome-headless-shell"
+
+# Chrome preferences shared by every session
+CHROME_PREFS: Final[Mapping[str, Any]] = {
+    "safebrowsing.enabled": True,
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+# Sub-resources never needed to drive a page: fonts, media and trackers.
+# Patterns match the whole URL, the trailing wildcard covers query strings
+# such as "?v=3" and "*.woff*" covers woff2 too.
+BLOCKED_URL_PATTERNS: Final[Tuple[str, ...]] = (
+    "*.woff*",
+    "*.ttf*",
+    "*.otf*",
+    "*.mp4*",
+    "*.webm*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+)
+
+# Seconds between checks of an explicit wait condition
+POLL_FREQUENCY: Final[float] = 0.1
+
+# RAM-backed filesystem used for downloads when available
+SHM_DIR: Final[Path] = Path("/dev/shm")
 
 
 class SeleniumBrowser:
@@ -30,6 +80,41 @@ class SeleniumBrowser:
         self.logger = logger
         self.driver: Optional[webdriver.Chrome] = None
         self.download_dir: Optional[Path] = None
+        self._download_dir_is_tmpfs = False
+    
+    @functools.cached_property
+    def chrome_options(self) -> ChromeOptions:
+        """Chrome options for this browser, built once as they only depend on the config."""
+        chrome_options = ChromeOptions()
+        # Return from navigation at DOMContentLoaded, explicit waits cover the rest
+        chrome_options.page_load_strategy = "eager"
+        for argument in CHROME_ARGS:
+            chrome_options.add_argument(argument)
+        
+        if self.config.chrome_binary:
+            chrome_options.binary_location = self.config.chrome_binary
+            self.logger.debug("Using Chrome binary", binary=self.config.chrome_binary)
+        
+        # chrome-headless-shell is always headless and has no new headless mode
+        if self.config.headless_mode and not Path(self.config.chrome_binary).name.startswith(
+            HEADLESS_SHELL_NAME
+        ):
+            chrome_options.add_argument("--headless=new")
+            self.logger.debug("Running in headless mode")
+        
+        # Set window size
+        chrome_options.add_argument(f"--window-size={self.config.browser_window_width},{self.config.browser_window_height}")
+        
+        # Reuse a persistent profile so cache, TLS sessions and cookies survive runs
+        if self.config.chrome_profile_dir:
+            profile_dir = Path(self.config.chrome_profile_dir).expanduser()
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+            chrome_options.add_argument("--profile-directory=Default")
+            self.logger.debug("Using persistent Chrome profile", profile_dir=str(profile_dir))
+        
+        chrome_options.add_experimental_option("prefs", dict(CHROME_PREFS))
+        return chrome_options
     
     def start(self) -> None:
         """Start the Chrome WebDriver with configured options."""
@@ -39,46 +124,46 @@ class SeleniumBrowser:
         
         self.logger.info("Starting Chrome WebDriver")
         
-        # Create download directory
-        self.download_dir = Path(tempfile.mkdtemp())
-        self.logger.debug("Created download directory", download_dir=str(self.download_dir))
-        
-        # Configure Chrome options
-        chrome_options = ChromeOptions()
-        
-        if self.config.headless_mode:
-            chrome_options.add_argument("--headless")
-            self.logger.debug("Running in headless mode")
-        
-        # Set window size
-        chrome_options.add_argument(f"--window-size={self.config.browser_window_width},{self.config.browser_window_height}")
-        
-        # Set download directory
-        prefs = {
-            "download.default_directory": str(self.download_dir),
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "safebrowsing.enabled": True
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
-        
-        # Additional options for stability
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
-        chrome_options.add_argument("--disable-javascript")
+        # Create download directory, in RAM when tmpfs is available
+        self._download_dir_is_tmpfs = SHM_DIR.is_dir() and os.access(SHM_DIR, os.W_OK)
+        self.download_dir = Path(
+            tempfile.mkdtemp(dir=SHM_DIR if self._download_dir_is_tmpfs else None)
+        )
+        self.logger.debug(
+            "Created download directory",
+            download_dir=str(self.download_dir),
+            tmpfs=self._download_dir_is_tmpfs,
+        )
         
         # Initialize the driver
         try:
-            service = ChromeService(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Selenium Manager resolves and caches chromedriver, SE_CHROMEDRIVER pins it
+            service = ChromeService()
+            self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
             
-            # Set timeouts
-            self.driver.implicitly_wait(self.config.implicit_wait)
+            # Set timeouts. Implicit waits stay disabled: they would stack on
+            # every poll of the explicit waits below, which use the configured
+            # implicit_wait as their default timeout instead.
+            self.driver.implicitly_wait(0)
             self.driver.set_page_load_timeout(self.config.page_load_timeout)
+            self.driver.set_script_timeout(self.config.script_timeout)
+            
+            # Set download directory through CDP, which unlike the download
+            # preferences is honoured by headless Chrome
+            self.driver.execute_cdp_cmd(
+                "Browser.setDownloadBehavior",
+                {
+                    "behavior": "allow",
+                    "downloadPath": str(self.download_dir.resolve()),
+                    "eventsEnabled": True,
+                },
+            )
+            
+            # Skip downloading resources that only matter for rendering
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)}
+            )
             
             self.logger.info("Chrome WebDriver started successfully")
             return self.driver
@@ -96,33 +181,86 @@ class SeleniumBrowser:
         
         # Clean up download directory
         if self.download_dir and self.download_dir.exists():
-            import shutil
             shutil.rmtree(self.download_dir)
             self.logger.debug("Cleaned up download directory")
     
-    def wait_for_element(self, by: By, value: str, timeout: int = 10) -> WebElement:
+    def wait_for_element(
+        self, by: Union[str, Locator], value: Optional[str] = None, timeout: Optional[int] = None
+    ) -> WebElement:
         """Wait for an element to be present and visible."""
         if self.driver is None:
             raise RuntimeError("WebDriver is not started")
         
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.presence_of_element_located((by, value)))
+        wait = self._wait(timeout)
+        return wait.until(EC.presence_of_element_located(_locator(by, value)))
     
-    def wait_for_clickable(self, by: By, value: str, timeout: int = 10) -> WebElement:
+    def wait_for_clickable(
+        self, by: Union[str, Locator], value: Optional[str] = None, timeout: Optional[int] = None
+    ) -> WebElement:
         """Wait for an element to be clickable."""
         if self.driver is None:
             raise RuntimeError("WebDriver is not started")
         
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.element_to_be_clickable((by, value)))
+        wait = self._wait(timeout)
+        return wait.until(EC.element_to_be_clickable(_locator(by, value)))
     
-    def wait_for_element_with_text(self, by: By, value: str, text: str, timeout: int = 10) -> WebElement:
+    def wait_for_any_visible(
+        self, by: Union[str, Locator], value: Optional[str] = None, timeout: Optional[int] = None
+    ) -> List[WebElement]:
+        """Wait for at least one matching element to be visible and return the visible ones."""
+        if self.driver is None:
+            raise RuntimeError("WebDriver is not started")
+        
+        wait = self._wait(timeout)
+        return wait.until(EC.visibility_of_any_elements_located(_locator(by, value)))
+    
+    def wait_for_element_with_text(
+        self,
+        by: Union[str, Locator],
+        value: Optional[str] = None,
+        *,
+        text: str,
+        timeout: Optional[int] = None,
+    ) -> WebElement:
         """Wait for an element to contain specific text."""
         if self.driver is None:
             raise RuntimeError("WebDriver is not started")
         
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.text_to_be_present_in_element((by, value), text))
+        locator = _locator(by, value)
+        
+        def element_with_text(driver: webdriver.Chrome) -> Union[WebElement, Literal[False]]:
+            element = driver.find_element(*locator)
+            return element if text in element.text else False
+        
+        wait = self._wait(timeout, ignored_exceptions=(StaleElementReferenceException,))
+        return wait.until(element_with_text)
+    
+    def wait_for_invisible(self, element: WebElement, timeout: Optional[int] = None) -> None:
+        """Wait for an element to be hidden or removed from the page."""
+        if self.driver is None:
+            raise RuntimeError("WebDriver is not started")
+        
+        wait = self._wait(timeout)
+        wait.until(EC.invisibility_of_element(element))
+    
+    def wait_for_url_change(self, url: str, timeout: Optional[int] = None) -> str:
+        """Wait for the current URL to differ from the given one and return it."""
+        if self.driver is None:
+            raise RuntimeError("WebDriver is not started")
+        
+        self._wait(timeout).until(EC.url_changes(url))
+        return self.driver.current_url
+    
+    def _wait(self, timeout: Optional[int], **kwargs: Any) -> WebDriverWait[webdriver.Chrome]:
+        """Build an explicit wait, defaulting to the configured timeout."""
+        if self.driver is None:
+            raise RuntimeError("WebDriver is not started")
+        return WebDriverWait(
+            self.driver,
+            self.config.implicit_wait if timeout is None else timeout,
+            poll_frequency=POLL_FREQUENCY,
+            **kwargs,
+        )
     
     def get_download_dir(self) -> Path:
         """Get the download directory path."""
@@ -138,3 +276,12 @@ class SeleniumBrowser:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.stop()
+
+
+def _locator(by: Union[str, Locator], value: Optional[str]) -> Locator:
+    """Build a (By, value) locator from either form accepted by the wait methods."""
+    if isinstance(by, tuple):
+        return by
+    if value is None:
+        raise ValueError("Locator value is required")
+    return (by, value)
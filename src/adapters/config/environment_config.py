@@ -45,6 +45,9 @@ class Env(str, Enum):
     BROWSER_WINDOW_HEIGHT = "BROWSER_WINDOW_HEIGHT"
     IMPLICIT_WAIT = "IMPLICIT_WAIT"
     PAGE_LOAD_TIMEOUT = "PAGE_LOAD_TIMEOUT"
+    SCRIPT_TIMEOUT = "SCRIPT_TIMEOUT"
+    CHROME_PROFILE_DIR = "CHROME_PROFILE_DIR"
+    CHROME_BINARY = "CHROME_BINARY"
     
     # Processing Settings
     MAX_INVOICES_PER_RUN = "MAX_INVOICES_PER_RUN"
@@ -85,6 +88,9 @@ class EnvironmentConfig(Config):
     browser_window_height: int = 1080
     implicit_wait: int = 10
     page_load_timeout: int = 30
+    script_timeout: int = 30
+    chrome_profile_dir: str = ""
+    chrome_binary: str = ""
     
     # Processing Settings
     max_invoices_per_run: int = 50
@@ -102,7 +108,7 @@ class EnvironmentConfig(Config):
         if self.browser_window_width <= 0 or self.browser_window_height <= 0:
             raise ValueError("browser window dimensions must be positive")
         
-        if self.implicit_wait <= 0 or self.page_load_timeout <= 0:
+        if self.implicit_wait <= 0 or self.page_load_timeout <= 0 or self.script_timeout <= 0:
             raise ValueError("timeout values must be positive")
         
         if self.max_invoices_per_run <= 0:
@@ -170,6 +176,9 @@ def create_environment_config() -> EnvironmentConfig:
         browser_window_height=get_env_int(Env.BROWSER_WINDOW_HEIGHT, 1080),
         implicit_wait=get_env_int(Env.IMPLICIT_WAIT, 10),
         page_load_timeout=get_env_int(Env.PAGE_LOAD_TIMEOUT, 30),
+        script_timeout=get_env_int(Env.SCRIPT_TIMEOUT, 30),
+        chrome_profile_dir=get_env_str(Env.CHROME_PROFILE_DIR),
+        chrome_binary=get_env_str(Env.CHROME_BINARY),
         
         # Processing Settings
         max_invoices_per_run=get_env_int(Env.MAX_INVOICES_PER_RUN, 50),
@@ -4,22 +4,69 @@ Repsol costs source adapter.
 Fetches electricity invoices from Repsol customer portal.
 """
 
-import io
 import re
+import shutil
 import time
 from abc import abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Iterator, Protocol, Final, Optional
-
-import PyPDF2
-import pdfplumber
+from typing import Iterator, Protocol, Final, Optional, Set, Tuple
 
 from src.core.domain.invoice import Invoice
 from src.core.ports.costs_source import CostsSource
 from src.core.ports.logger import Logger
-from src.core.ports.browser import Browser, By, WebElement
+from src.core.ports.browser import (
+    Browser,
+    By,
+    StaleElementReferenceException,
+    WebElement,
+)
+
+
+# Suffixes of files the browser is still writing
+PARTIAL_DOWNLOAD_SUFFIXES: Final[Tuple[str, ...]] = (".crdownload", ".part", ".tmp")
+
+# Fills the login fields through the native value setter so the React form
+# state sees the input and change events, then submits it
+FILL_LOGIN_FORM_JS: Final[str] = """
+const [username, usernameValue, password, passwordValue, submit] = arguments;
+const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+for (const [field, value] of [[username, usernameValue], [password, passwordValue]]) {
+    setValue.call(field, value);
+    field.dispatchEvent(new Event("input", { bubbles: true }));
+    field.dispatchEvent(new Event("change", { bubbles: true }));
+}
+submit.click();
+"""
+
+# Returns the first visible element matching the selectors, tried in order so
+# an accept button wins over any other button in the same banner
+FIRST_VISIBLE_JS: Final[str] = """
+for (const selector of arguments[0]) {
+    for (const element of document.querySelectorAll(selector)) {
+        if (element.getClientRects().length > 0
+                && getComputedStyle(element).visibility !== "hidden") {
+            return element;
+        }
+    }
+}
+return null;
+"""
+
+# Invoice PDF text patterns
+# e.g. "Fecha de emisión 15/01/2024"
+EMISSION_DATE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"Fecha de emisión\s+(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})", re.IGNORECASE
+)
+# e.g. "IVA (21 %) de 50,02 10,50 €"
+IVA_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"IVA\s*\(21\s*%\)\s*de\s*\d+[.,]\d+\s+(\d+[.,]\d+)\s*€", re.IGNORECASE
+)
+# e.g. "Total factura 60,52 €"
+TOTAL_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"Total factura\s+(\d+[.,]\d+)\s*€", re.IGNORECASE
+)
 
 
 class RepsolConfig(Protocol):
@@ -46,6 +93,35 @@ class RepsolCostsSource(CostsSource):
 
     # URLs
     INVOICES_URL: Final[str] = "https://areacliente.repsol.es/mis-facturas"
+    COOKIE_DOMAIN: Final[str] = ".repsol.es"
+
+    # Locators
+    DOWNLOAD_BUTTONS_XPATH: Final[str] = "//button[contains(normalize-space(.), 'Descargar')]"
+    LOGIN_OR_PORTAL_XPATH: Final[str] = (
+        "//input[@id='mail'] | //a[normalize-space(.)='Facturas']"
+    )
+    # Common cookie accept buttons by priority, accept-specific ones before the
+    # generic cookie and consent ones that may also match settings buttons
+    COOKIE_ACCEPT_SELECTORS: Final[Tuple[str, ...]] = (
+        "#onetrust-accept-btn-handler",
+        "#cookie-accept",
+        "#accept-cookies",
+        ".cookie-accept",
+        ".accept-cookies",
+        "button[id*='accept']",
+        "button[class*='accept']",
+        "[data-testid*='accept']",
+        "#cookie-consent",
+        ".cookie-consent",
+        "button[id*='cookie']",
+        "button[class*='cookie']",
+        "button[id*='consent']",
+        "button[class*='consent']",
+        "[data-testid*='cookie']",
+        "[data-testid*='consent']",
+        ".cookie-banner button",
+        ".consent-banner button",
+    )
 
     def __init__(
         self,
@@ -71,21 +147,7 @@ class RepsolCostsSource(CostsSource):
         self.browser.start()
         try:
             self.logger.info("Finding Repsol invoices")
-
-            # Login to Repsol
-            self.browser.driver.get(self.INVOICES_URL)
-            self._login()
-
-            # Navigate to invoices page
-            facturas_link = self.browser.wait_for_element(
-                By.LINK_TEXT, "Facturas", timeout=30
-            )
-            facturas_link.click()
-
-            # Wait for the invoices page to load - wait for h1 with "Facturas" text
-            self.browser.wait_for_element_with_text(
-                By.TAG_NAME, "h1", "Facturas", timeout=30
-            )
+            self._navigate_to_invoices()
 
             # Try to download new invoices first
             for file_path in self._download_invoices():
@@ -93,19 +155,10 @@ class RepsolCostsSource(CostsSource):
                     # Extract metadata from the PDF file
                     invoice = self._extract_metadata_from_pdf_file(file_path)
 
-                    # Set the concept, type, and deductible percentage
-                    invoice.concept = self.CONCEPT
-                    invoice.type = self.TYPE
-                    invoice.deductible_percentage = self.DEDUCTIBLE_PERCENTAGE
-
                     self.logger.info(
                         "Successfully processed Repsol invoice from file",
-                        file_name=invoice.file_name,
-                        date=(
-                            invoice.invoice_date.isoformat()
-                            if invoice.invoice_date
-                            else "unknown"
-                        ),
+                        path=str(invoice.path),
+                        date=invoice.invoice_date.isoformat(),
                         cost_euros=float(invoice.cost_euros),
                         iva_euros=float(invoice.iva_euros),
                     )
@@ -125,88 +178,119 @@ class RepsolCostsSource(CostsSource):
         finally:
             self.browser.stop()
 
+    def _navigate_to_invoices(self) -> None:
+        """Login and open the invoices page of the Repsol customer portal."""
+        self._preset_cookie_consent()
+        self.browser.driver.get(self.INVOICES_URL)
+
+        # A session persisted in the Chrome profile lands straight in the portal.
+        # Only visible matches count, a page may render the other one hidden,
+        # and the login field wins over a portal link in the login page header.
+        entries = self.browser.wait_for_any_visible(
+            By.XPATH, self.LOGIN_OR_PORTAL_XPATH, timeout=30
+        )
+        if any(entry.get_attribute("id") == "mail" for entry in entries):
+            self._login()
+        else:
+            self.logger.info("Reusing existing Repsol session")
+
+        # Navigate to invoices page
+        facturas_link = self.browser.wait_for_element(
+            By.LINK_TEXT, "Facturas", timeout=30
+        )
+        facturas_link.click()
+
+        # Wait for the invoices page to load - wait for h1 with "Facturas" text
+        self.browser.wait_for_element_with_text(
+            By.TAG_NAME, "h1", text="Facturas", timeout=30
+        )
+
+    def _preset_cookie_consent(self) -> None:
+        """Store the OneTrust consent cookie so the cookie banner is never rendered."""
+        self.browser.driver.execute_cdp_cmd(
+            "Network.setCookie",
+            {
+                "name": "OptanonAlertBoxClosed",
+                "value": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "domain": self.COOKIE_DOMAIN,
+                "path": "/",
+                "secure": True,
+            },
+        )
+
     def _login(self) -> None:
         """Login to Repsol customer portal."""
         self.logger.info("Logging into Repsol customer portal")
-        # Handle cookie policy if present
-        self._accept_cookie_policy(timeout=10)
-        # Fill username
         username_field = self.browser.wait_for_element(By.ID, "mail", timeout=30)
-        username_field.clear()
-        username_field.send_keys(self.username)
-        # Fill password
+        # Handle cookie policy if present, by now the banner has been rendered
+        self._accept_cookie_policy()
         password_field = self.browser.wait_for_element(By.ID, "pass", timeout=30)
-        password_field.clear()
-        password_field.send_keys(self.password)
-        # Submit login form
         login_button = self.browser.wait_for_clickable(
             By.CSS_SELECTOR, "button[type='submit']", timeout=30
         )
-        login_button.click()
+        login_url = self.browser.driver.current_url
+        # Fill both fields and submit the form in a single round-trip
+        self.browser.driver.execute_script(
+            FILL_LOGIN_FORM_JS,
+            username_field,
+            self.username,
+            password_field,
+            self.password,
+            login_button,
+        )
+        self.browser.wait_for_url_change(login_url, timeout=30)
         self.logger.info("Successfully logged into Repsol customer portal")
 
     def _get_download_buttons(self) -> list[WebElement]:
         """Get all download buttons."""
-        # Wait for "Hogares" label to be present. Meaning that the facturas
-        # page is loaded.
-        self.browser.wait_for_element_with_text(By.TAG_NAME, "label", "Hogares")
-        # Get all buttons.
-        all_buttons = self.browser.driver.find_elements(By.CSS_SELECTOR, "button")
-        # Filter by text content.
-        return [
-            button
-            for button in all_buttons
-            if "Descargar" in button.get_attribute("innerText")
-        ]
+        # Filter buttons by text content inside the browser.
+        return self.browser.driver.find_elements(By.XPATH, self.DOWNLOAD_BUTTONS_XPATH)
 
     def _download_invoices(self) -> Iterator[Path]:
         """Generator that downloads invoice files one by one to the artifacts directory."""
         try:
-
-            # Wait for "Hogares" label to be present
+            # Wait for "Hogares" label to be present. Meaning that the facturas
+            # page is loaded.
+            self.browser.wait_for_element_with_text(By.TAG_NAME, "label", text="Hogares")
 
             self.logger.info("Starting to download Repsol invoices")
 
-            len_download_buttons = len(self._get_download_buttons())
+            download_buttons = self._get_download_buttons()
+            len_download_buttons = len(download_buttons)
             self.logger.info("Found download elements", count=len_download_buttons)
 
             # Create artifacts directory if it doesn't exist
             if not self.artifacts_dir:
                 raise ValueError("Artifacts directory not specified")
 
-            artifacts_path = Path(self.artifacts_dir)
-            artifacts_path.mkdir(parents=True, exist_ok=True)
-
             # Create a subdirectory for Repsol invoices
-            repsol_dir = artifacts_path / "repsol"
-            repsol_dir.mkdir(exist_ok=True)
+            repsol_dir = Path(self.artifacts_dir) / "repsol"
+            repsol_dir.mkdir(parents=True, exist_ok=True)
 
             # Download each invoice one by one
             for i in range(len_download_buttons):
                 try:
-                    download_button = self._get_download_buttons()[i]
-
                     self.logger.info(
                         "Downloading invoice", index=i + 1, total=len_download_buttons
                     )
 
                     # Click the download element
-                    download_button.click()
-
-                    # Wait a moment for the download to start
-                    time.sleep(1)
+                    existing_files = {
+                        path.name for path in self.browser.get_download_dir().iterdir()
+                    }
+                    try:
+                        download_buttons[i].click()
+                    except StaleElementReferenceException:
+                        # The page re-rendered the list, query it again
+                        download_buttons = self._get_download_buttons()
+                        download_buttons[i].click()
 
                     # Wait for download to complete and get the file path
-                    downloaded_file = self._wait_for_download(
-                        f"repsol_invoice_{i+1}.pdf"
-                    )
+                    downloaded_file = self._wait_for_download(existing_files)
 
                     # Move the file to the artifacts directory with a proper name
                     final_path = repsol_dir / f"repsol_invoice_{i+1}.pdf"
-                    if downloaded_file != final_path:
-                        import shutil
-
-                        shutil.move(str(downloaded_file), str(final_path))
+                    shutil.move(downloaded_file, final_path)
 
                     self.logger.info(
                         "Successfully downloaded invoice",
@@ -241,12 +325,8 @@ class RepsolCostsSource(CostsSource):
             ValueError: If the PDF cannot be processed or metadata cannot be extracted
         """
         try:
-            # Read the PDF file
-            with open(path, "rb") as f:
-                content = f.read()
-
             # Extract text from PDF
-            text = self._extract_text_from_pdf(content)
+            text = self._extract_text_from_pdf(path)
 
             # Extract invoice date
             invoice_date = self._extract_invoice_date(text)
@@ -265,11 +345,7 @@ class RepsolCostsSource(CostsSource):
             )
 
             self.logger.debug(
-                "Successfully extracted metadata from Repsol PDF file",
-                path=path,
-                invoice_date=invoice_date.isoformat(),
-                cost_euros=float(cost_euros),
-                iva_euros=float(iva_euros),
+                "Successfully extracted metadata from Repsol PDF file", path=path
             )
 
             return invoice
@@ -282,11 +358,16 @@ class RepsolCostsSource(CostsSource):
             )
             raise ValueError(f"Failed to extract metadata from Repsol PDF file: {e}")
 
-    def _extract_text_from_pdf(self, content: bytes) -> str:
-        """Extract text content from Repsol PDF bytes."""
+    def _extract_text_from_pdf(self, path: str) -> str:
+        """Extract text content from a Repsol PDF file."""
+        # Imported lazily: the PDF stack is heavy and only needed once an
+        # invoice has been downloaded
+        import PyPDF2
+        import pdfplumber
+
         try:
             # Try with pdfplumber first (better for complex layouts)
-            with pdfplumber.open(io.BytesIO(content)) as pdf:
+            with pdfplumber.open(path) as pdf:
                 text = ""
                 for page in pdf.pages:
                     page_text = page.extract_text()
@@ -297,7 +378,7 @@ class RepsolCostsSource(CostsSource):
                     return text
 
             # Fallback to PyPDF2
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+            pdf_reader = PyPDF2.PdfReader(path)
             text = ""
             for page in pdf_reader.pages:
                 text += page.extract_text() + "\n"
@@ -316,10 +397,7 @@ class RepsolCostsSource(CostsSource):
         Raises:
             ValueError: If the date pattern cannot be found or parsed.
         """
-        fecha_emision_pattern = (
-            r"Fecha de emisión\s+(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})"
-        )
-        match = re.search(fecha_emision_pattern, text, re.IGNORECASE)
+        match = EMISSION_DATE_PATTERN.search(text)
         if not match:
             raise ValueError(
                 "Could not find 'Fecha de emisión' pattern in invoice PDF"
@@ -344,8 +422,7 @@ class RepsolCostsSource(CostsSource):
             ValueError: If the amount patterns cannot be found or parsed.
         """
         # Extract IVA amount from pattern: "IVA (21 %) de 50,02 10,50 €"
-        iva_pattern = r"IVA\s*\(21\s*%\)\s*de\s*\d+[.,]\d+\s+(\d+[.,]\d+)\s*€"
-        iva_match = re.search(iva_pattern, text, re.IGNORECASE)
+        iva_match = IVA_PATTERN.search(text)
         if not iva_match:
             raise ValueError(
                 "Could not find IVA amount pattern 'IVA (21 %) de X,XX Y,YY €' in invoice PDF"
@@ -360,8 +437,7 @@ class RepsolCostsSource(CostsSource):
             ) from e
 
         # Extract total invoice amount from pattern: "Total factura X,XX €"
-        total_pattern = r"Total factura\s+(\d+[.,]\d+)\s*€"
-        total_match = re.search(total_pattern, text, re.IGNORECASE)
+        total_match = TOTAL_PATTERN.search(text)
         if not total_match:
             raise ValueError(
                 "Could not find total amount pattern 'Total factura X,XX €' in invoice PDF"
@@ -379,86 +455,44 @@ class RepsolCostsSource(CostsSource):
 
     def _accept_cookie_policy(self, timeout: int = 10) -> bool:
         """Accept cookie policy if present. Returns True if accepted, False if not found."""
-        # Common cookie policy button selectors
-        cookie_selectors = [
-            # Generic cookie accept buttons
-            "button[id*='accept']",
-            "button[class*='accept']",
-            "button[id*='cookie']",
-            "button[class*='cookie']",
-            "button[id*='consent']",
-            "button[class*='consent']",
-            # Common text-based selectors
-            "button:contains('Accept')",
-            "button:contains('Aceptar')",
-            "button:contains('Accept All')",
-            "button:contains('Aceptar todo')",
-            "button:contains('Accept Cookies')",
-            "button:contains('Aceptar cookies')",
-            # Common ID/class patterns
-            "#cookie-accept",
-            "#accept-cookies",
-            "#cookie-consent",
-            ".cookie-accept",
-            ".accept-cookies",
-            ".cookie-consent",
-            ".cookie-banner button",
-            ".consent-banner button",
-            # Repsol-specific selectors (if any)
-            "[data-testid*='cookie']",
-            "[data-testid*='accept']",
-            "[data-testid*='consent']",
-        ]
-
         try:
-            # Try to find and click cookie accept button
-            for selector in cookie_selectors:
-                try:
-                    element = self.browser.wait_for_element(By.CSS_SELECTOR, selector)
-                    self.logger.debug("Accepted cookie policy banner")
-                    element.click()
-                    time.sleep(0.1)
-                    return True
-                except Exception:
-                    # Continue to next selector if this one doesn't work
-                    continue
-            else:
+            # Probe without waiting, most runs have the consent already stored
+            element: Optional[WebElement] = self.browser.driver.execute_script(
+                FIRST_VISIBLE_JS, list(self.COOKIE_ACCEPT_SELECTORS)
+            )
+            if element is None:
                 self.logger.debug("No cookie policy banner found")
                 return False
+
+            element.click()
+            self.browser.wait_for_invisible(element, timeout=timeout)
+            self.logger.debug("Accepted cookie policy banner")
+            return True
         except Exception as e:
             self.logger.warning("Error handling cookie policy", error=str(e))
             return False
 
-    def _wait_for_download(self, filename: str, timeout: int = 30):
-        """Wait for a file to be downloaded and return its path."""
+    def _wait_for_download(
+        self, existing_files: Set[str], timeout: float = 30, interval: float = 0.25
+    ) -> Path:
+        """Wait for a new completed file in the download directory and return its path."""
         download_dir = self.browser.get_download_dir()
-        self.logger.debug("Waiting for download", filename=filename, timeout=timeout)
-
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            # Check for the file in the download directory
-            file_path = download_dir / filename
-
-            # Also check for .crdownload files (Chrome download in progress)
-            crdownload_path = download_dir / f"{filename}.crdownload"
-
-            # Check for any PDF files that might be the download
-            pdf_files = list(download_dir.glob("*.pdf"))
-
-            if file_path.exists() and not crdownload_path.exists():
-                return file_path
-
-            # If we find any PDF file, it might be our download with a different name
-            if pdf_files and not any(f.name == filename for f in pdf_files):
-                # Check if any PDF was created recently (within last 10 seconds)
-                recent_pdfs = [
-                    f for f in pdf_files if time.time() - f.stat().st_mtime < 10
-                ]
-                if recent_pdfs:
-                    return recent_pdfs[0]
-
-            time.sleep(0.5)
-
-        raise TimeoutError(
-            f"Download timeout: {filename} not found after {timeout} seconds"
-        )
+        self.logger.debug("Waiting for download", timeout=timeout)
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            new_files = [
+                file_path
+                for file_path in download_dir.iterdir()
+                if file_path.name not in existing_files
+            ]
+            # A file may appear under its final name while still being written,
+            # the download is only complete once no partial file is left
+            if new_files and not any(
+                file_path.name.endswith(PARTIAL_DOWNLOAD_SUFFIXES) for file_path in new_files
+            ):
+                return new_files[0]
+
+            time.sleep(interval)
+
+        raise TimeoutError(f"Download timeout: no completed file after {timeout} seconds")
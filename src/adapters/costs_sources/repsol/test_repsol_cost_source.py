@@ -7,26 +7,41 @@ These tests use encrypted test data to avoid exposing real invoice information.
 from decimal import Decimal
 from pathlib import Path
 import datetime
-from unittest.mock import Mock
+import re
+from unittest.mock import Mock, patch
+
+import pytest
 
 from src.adapters.costs_sources.repsol.repsol_costs_source import RepsolCostsSource
 from src.core.domain.invoice import Invoice
 
+# Emission date of the encrypted sample invoice
+INVOICE_DATE = datetime.datetime(2025, 10, 28)
 
-def test_extract_metadata_from_pdf_file(
-    logger, decrypt_test_data, repsol_test_password
-):
-    """Test metadata extraction using real encrypted test PDFs."""
-    test_data = Path(__file__).parent / "test_data" / "repsol_invoice.encrypted"
+# Expected parsing errors, compiled once for every parametrized case
+MISSING_DATE_ERROR = re.compile("Could not find 'Fecha de emisión'")
+INVALID_DATE_ERROR = re.compile("Could not parse invoice date")
+MISSING_IVA_ERROR = re.compile("Could not find IVA amount")
+MISSING_TOTAL_ERROR = re.compile("Could not find total amount")
 
-    # Create RepsolCostsSource instance
-    repsol_source = RepsolCostsSource(
+
+@pytest.fixture(scope="module")
+def repsol_source(logger):
+    """Create a RepsolCostsSource, shared by the module, that never touches the browser."""
+    return RepsolCostsSource(
         config=Mock(),
         browser=Mock(),
         logger=logger,
         artifacts_dir="/tmp/test_artifacts",
     )
 
+
+def test_extract_metadata_from_pdf_file(
+    repsol_source, decrypt_test_data, repsol_test_password
+):
+    """Test metadata extraction using real encrypted test PDFs."""
+    test_data = Path(__file__).parent / "test_data" / "repsol_invoice.encrypted"
+
     # Test with the repsol invoice
     temp_pdf_path = decrypt_test_data(test_data, repsol_test_password)
 
@@ -35,9 +50,130 @@ def test_extract_metadata_from_pdf_file(
 
     # Verify basic structure
     assert isinstance(invoice, Invoice)
-    assert invoice.invoice_date == datetime.datetime(2025, 10, 28)
+    assert invoice.invoice_date == INVOICE_DATE
     assert invoice.concept == "Luz Repsol"
     assert invoice.type == "Suministros"
     assert invoice.cost_euros == Decimal("60.52")
     assert invoice.iva_euros == Decimal("10.50")
     assert invoice.path == temp_pdf_path
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Fecha de emisión 28/10/2025", INVOICE_DATE),
+        ("Fecha de emisión 5-3-2024", datetime.datetime(2024, 3, 5)),
+        ("FECHA DE EMISIÓN   01/02/2024", datetime.datetime(2024, 2, 1)),
+    ],
+)
+def test_extract_invoice_date(repsol_source, text, expected):
+    """Test the emission date is parsed from the supported formats."""
+    assert repsol_source._extract_invoice_date(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, match",
+    [
+        ("Fecha de factura 28/10/2025", MISSING_DATE_ERROR),
+        ("Fecha de emisión 31/02/2024", INVALID_DATE_ERROR),
+    ],
+)
+def test_extract_invoice_date_invalid(repsol_source, text, match):
+    """Test a missing or impossible emission date is rejected."""
+    with pytest.raises(ValueError, match=match):
+        repsol_source._extract_invoice_date(text)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (
+            "IVA (21 %) de 50,02 10,50 €\nTotal factura 60,52 €",
+            (Decimal("60.52"), Decimal("10.50")),
+        ),
+        (
+            "IVA (21%) de 50.02 10.50€\nTotal factura 60.52€",
+            (Decimal("60.52"), Decimal("10.50")),
+        ),
+    ],
+)
+def test_extract_amounts(repsol_source, text, expected):
+    """Test the total and IVA amounts are parsed with either decimal separator."""
+    assert repsol_source._extract_amounts(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, match",
+    [
+        ("Total factura 60,52 €", MISSING_IVA_ERROR),
+        ("IVA (21 %) de 50,02 10,50 €", MISSING_TOTAL_ERROR),
+    ],
+)
+def test_extract_amounts_missing(repsol_source, text, match):
+    """Test a missing amount is rejected."""
+    with pytest.raises(ValueError, match=match):
+        repsol_source._extract_amounts(text)
+
+
+@pytest.fixture
+def download_source(logger, tmp_path):
+    """Create a RepsolCostsSource whose browser downloads into a temporary directory."""
+    browser = Mock()
+    browser.get_download_dir.return_value = tmp_path
+    return RepsolCostsSource(
+        config=Mock(),
+        browser=browser,
+        logger=logger,
+        artifacts_dir=str(tmp_path / "artifacts"),
+    )
+
+
+def test_wait_for_download(download_source, tmp_path):
+    """Test only a new completed file is taken as the download."""
+    (tmp_path / "previous.pdf").touch()
+    (tmp_path / "invoice.pdf").touch()
+
+    downloaded = download_source._wait_for_download({"previous.pdf"}, timeout=1)
+
+    assert downloaded == tmp_path / "invoice.pdf"
+
+
+@pytest.mark.parametrize(
+    "names",
+    [
+        ["invoice.pdf.crdownload"],
+        # Still being written under its final name
+        ["invoice.pdf.crdownload", "invoice.pdf"],
+    ],
+)
+def test_wait_for_download_timeout(download_source, tmp_path, names):
+    """Test a download that never completes times out."""
+    (tmp_path / "previous.pdf").touch()
+    for name in names:
+        (tmp_path / name).touch()
+
+    with pytest.raises(TimeoutError, match="no completed file after 0.05 seconds"):
+        download_source._wait_for_download({"previous.pdf"}, timeout=0.05, interval=0.01)
+
+
+@pytest.mark.parametrize(
+    "visible_ids, logs_in",
+    [
+        (["mail"], True),
+        ([None], False),
+        # Portal link in the header of the login page
+        ([None, "mail"], True),
+    ],
+)
+def test_navigate_to_invoices_login_detection(logger, visible_ids, logs_in):
+    """Test the login runs only when the login field is among the visible entries."""
+    browser = Mock()
+    browser.wait_for_any_visible.return_value = [
+        Mock(**{"get_attribute.return_value": element_id}) for element_id in visible_ids
+    ]
+    source = RepsolCostsSource(config=Mock(), browser=browser, logger=logger)
+
+    with patch.object(source, "_login") as login:
+        source._navigate_to_invoices()
+
+    assert login.called == logs_in
@@ -4,16 +4,33 @@ Structlog logger adapter implementation.
 Implements the Logger port using structlog for structured logging.
 """
 
+import functools
 import logging
 import sys
 from typing import Any, Dict
 
+import orjson
 import structlog
 from colorama import Fore, Style, init
 
 from src.core.ports.logger import Logger
 
 
+@functools.lru_cache(maxsize=None)
+def get_logger(name: str) -> Any:
+    """Get the structlog logger for a name, building it only once per name."""
+    return structlog.get_logger(name)
+
+
+def _orjson_dumps(event_dict: Dict[str, Any], **kwargs: Any) -> str:
+    """Serialize a log event with orjson, keeping structlog's fallback handler."""
+    return orjson.dumps(
+        event_dict,
+        default=kwargs.get("default"),
+        option=orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
 class Structlog(Logger):
     """Structlog implementation of the Logger port."""
     
@@ -27,7 +44,7 @@ class Structlog(Logger):
             self._configure_structlog(log_level)
             Structlog._configured = True
         
-        self._logger = structlog.get_logger(name)
+        self._logger = get_logger(name)
     
     def _configure_structlog(self, log_level: str) -> None:
         """Configure structlog for the application."""
@@ -42,7 +59,7 @@ class Structlog(Logger):
                 structlog.processors.StackInfoRenderer(),
                 structlog.processors.format_exc_info,
                 structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer() if log_level == "DEBUG" else self._colorize_processor,
+                structlog.processors.JSONRenderer(serializer=_orjson_dumps) if log_level == "DEBUG" else self._colorize_processor,
             ],
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
@@ -19,6 +19,17 @@ def project_root():
     return Path(__file__).parent.parent
 
 
+@pytest.fixture(scope="session")
+def xdist_worker_suffix():
+    """
+    Return the pytest-xdist worker id, empty when not running distributed.
+
+    Unlike the "worker_id" fixture of pytest-xdist, which is "master" outside
+    of workers, the empty suffix keeps the undistributed paths unchanged.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "")
+
+
 @pytest.fixture(scope="session")
 def load_env(project_root):
     """Load environment variables from .env file in project root."""
@@ -26,21 +37,21 @@ def load_env(project_root):
 
 
 @pytest.fixture(scope="session")
-def artifacts_dir(project_root):
-    """Return the test artifacts directory."""
-    artifacts = project_root / "test-artifacts"
-    artifacts.mkdir(exist_ok=True)
+def artifacts_dir(project_root, xdist_worker_suffix):
+    """Return the test artifacts directory, one per pytest-xdist worker."""
+    artifacts = project_root / "test-artifacts" / xdist_worker_suffix
+    artifacts.mkdir(parents=True, exist_ok=True)
     return artifacts
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def logger():
     """Create a logger instance for testing."""
     return SimpleLogger("test_integration")
 
 
-@pytest.fixture(scope="function")
-def config(request):
+@pytest.fixture(scope="session")
+def config(request, load_env, xdist_worker_suffix):
     """Create a configuration instance for testing."""
     TestConfig = namedtuple('TestConfig', [
         'repsol_username',
@@ -49,9 +60,16 @@ def config(request):
         'browser_window_width',
         'browser_window_height',
         'implicit_wait',
-        'page_load_timeout'
+        'page_load_timeout',
+        'script_timeout',
+        'chrome_profile_dir',
+        'chrome_binary'
     ])
     no_headless = request.config.getoption("--no-headless", default=False)
+    # Chrome locks its profile, so parallel workers cannot share one
+    chrome_profile_dir = get_env_str(Env.CHROME_PROFILE_DIR)
+    if chrome_profile_dir and xdist_worker_suffix:
+        chrome_profile_dir = f"{chrome_profile_dir}-{xdist_worker_suffix}"
     return TestConfig(
         repsol_username=get_env_str(Env.REPSOL_USERNAME),
         repsol_password=get_env_str(Env.REPSOL_PASSWORD),
@@ -59,13 +77,16 @@ def config(request):
         browser_window_width=1920,
         browser_window_height=1080,
         implicit_wait=10,
-        page_load_timeout=30
+        page_load_timeout=30,
+        script_timeout=30,
+        chrome_profile_dir=chrome_profile_dir,
+        chrome_binary=get_env_str(Env.CHROME_BINARY)
     )
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def browser(config, logger):
-    """Create a browser instance for testing."""
+    """Create a browser instance shared by the whole test session."""
     browser_instance = SeleniumBrowser(config, logger)
     yield browser_instance
     # Cleanup: ensure browser is stopped after test
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Optional, Final
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ArchiveResult:
     """Result of archiving an invoice file to cloud storage."""
     
@@ -7,14 +7,19 @@ Represents an invoice that has been processed and registered in the system.
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, Final, Literal
+from enum import StrEnum
+from typing import Optional
 
 
-# Type aliases for better readability
-InvoiceStatus = Literal["success", "failed", "skipped"]
+class InvoiceStatus(StrEnum):
+    """Processing status of a registered invoice, equal to its string value."""
+    
+    SUCCESS = "success"
+    FAILED = "failed"
+    SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RegisteredInvoice:
     """Represents an invoice that has been processed and registered."""
     
@@ -50,10 +55,12 @@ class RegisteredInvoice:
         if not self.file_hash.strip():
             raise ValueError("File hash cannot be empty")
         
-        # Status validation is handled by the Literal type, but we can add runtime validation
-        valid_statuses: Final[tuple[InvoiceStatus, ...]] = ("success", "failed", "skipped")
-        if self.status not in valid_statuses:
-            raise ValueError(f"Status must be one of {valid_statuses}")
+        # Coerce plain strings, e.g. read back from the registry
+        try:
+            object.__setattr__(self, "status", InvoiceStatus(self.status))
+        except ValueError:
+            valid_statuses = tuple(status.value for status in InvoiceStatus)
+            raise ValueError(f"Status must be one of {valid_statuses}") from None
     
     @property
     def total_euros(self) -> Decimal:
@@ -68,7 +75,7 @@ class RegisteredInvoice:
     @property
     def is_successful(self) -> bool:
         """Check if the invoice was processed successfully."""
-        return self.status == "success"
+        return self.status is InvoiceStatus.SUCCESS
     
     @property
     def has_google_drive_id(self) -> bool:
@@ -0,0 +1,68 @@
+"""
+Unit tests for the registered invoice domain model.
+"""
+
+from dataclasses import FrozenInstanceError, asdict
+from datetime import datetime
+from decimal import Decimal
+import re
+
+import pytest
+
+from src.core.domain.registered_invoice import InvoiceStatus, RegisteredInvoice
+
+# Expected validation error, listing the valid statuses
+INVALID_STATUS_ERROR = re.compile(r"Status must be one of \('success', 'failed', 'skipped'\)")
+
+
+def make_registered_invoice(status):
+    """Create a valid registered invoice with the given status."""
+    return RegisteredInvoice(
+        invoice_date=datetime(2025, 10, 28),
+        concept="Luz Repsol",
+        type="Suministros",
+        cost_euros=Decimal("60.52"),
+        iva_euros=Decimal("10.50"),
+        deductible_percentage=0.5,
+        file_hash="abc123",
+        google_drive_id=None,
+        onedrive_id=None,
+        processed_date=datetime(2025, 10, 29),
+        status=status,
+    )
+
+
+@pytest.mark.parametrize(
+    "status, expected",
+    [
+        ("success", InvoiceStatus.SUCCESS),
+        ("failed", InvoiceStatus.FAILED),
+        (InvoiceStatus.SKIPPED, InvoiceStatus.SKIPPED),
+    ],
+)
+def test_status_is_coerced(status, expected):
+    """Test plain strings, e.g. read back from the registry, become the enum."""
+    invoice = make_registered_invoice(status)
+
+    assert invoice.status is expected
+    assert invoice.status == expected.value
+    assert invoice.is_successful == (expected is InvoiceStatus.SUCCESS)
+
+
+@pytest.mark.parametrize("status", ["pending", "SUCCESS", ""])
+def test_status_invalid(status):
+    """Test an unknown status is rejected listing the valid ones."""
+    with pytest.raises(ValueError, match=INVALID_STATUS_ERROR):
+        make_registered_invoice(status)
+
+
+def test_registered_invoice_is_frozen():
+    """Test a registered invoice cannot be changed and only exposes its fields."""
+    invoice = make_registered_invoice("success")
+
+    with pytest.raises(FrozenInstanceError):
+        invoice.cost_euros = Decimal("0")
+
+    assert invoice.total_euros == Decimal("71.02")
+    assert invoice == make_registered_invoice(InvoiceStatus.SUCCESS)
+    assert "total_euros" not in asdict(invoice)
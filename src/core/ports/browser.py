@@ -7,14 +7,18 @@ This allows for dependency injection and makes the browser system testable.
 
 from abc import abstractmethod
 from pathlib import Path
-from typing import Protocol
+from typing import List, Optional, Protocol, Tuple, Union
 
 from selenium import webdriver
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
 # Re-export commonly used selenium types for convenience
-__all__ = ["Browser", "By", "WebElement"]
+__all__ = ["Browser", "By", "Locator", "StaleElementReferenceException", "WebElement"]
+
+# Pre-built (By, value) pair, as accepted by selenium's expected conditions
+Locator = Tuple[str, str]
 
 
 class Browser(Protocol):
@@ -37,20 +41,48 @@ class Browser(Protocol):
         pass
     
     @abstractmethod
-    def wait_for_element(self, by: By, value: str, timeout: int = 10) -> WebElement:
+    def wait_for_element(
+        self, by: Union[str, Locator], value: Optional[str] = None, timeout: Optional[int] = None
+    ) -> WebElement:
         """Wait for an element to be present and visible."""
         pass
     
     @abstractmethod
-    def wait_for_clickable(self, by: By, value: str, timeout: int = 10) -> WebElement:
+    def wait_for_clickable(
+        self, by: Union[str, Locator], value: Optional[str] = None, timeout: Optional[int] = None
+    ) -> WebElement:
         """Wait for an element to be clickable."""
         pass
     
     @abstractmethod
-    def wait_for_element_with_text(self, by: By, value: str, text: str, timeout: int = 10) -> WebElement:
+    def wait_for_any_visible(
+        self, by: Union[str, Locator], value: Optional[str] = None, timeout: Optional[int] = None
+    ) -> List[WebElement]:
+        """Wait for at least one matching element to be visible and return the visible ones."""
+        pass
+    
+    @abstractmethod
+    def wait_for_element_with_text(
+        self,
+        by: Union[str, Locator],
+        value: Optional[str] = None,
+        *,
+        text: str,
+        timeout: Optional[int] = None,
+    ) -> WebElement:
         """Wait for an element to contain specific text."""
         pass
     
+    @abstractmethod
+    def wait_for_invisible(self, element: WebElement, timeout: Optional[int] = None) -> None:
+        """Wait for an element to be hidden or removed from the page."""
+        pass
+    
+    @abstractmethod
+    def wait_for_url_change(self, url: str, timeout: Optional[int] = None) -> str:
+        """Wait for the current URL to differ from the given one and return it."""
+        pass
+    
     @abstractmethod
     def get_download_dir(self) -> Path:
         """Get the download directory path."""
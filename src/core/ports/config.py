@@ -134,7 +134,7 @@ class Config(Protocol):
     @property
     @abstractmethod
     def implicit_wait(self) -> int:
-        """Implicit wait timeout."""
+        """Default timeout in seconds for explicit element waits."""
         pass
     
     @property
@@ -143,6 +143,24 @@ class Config(Protocol):
         """Page load timeout."""
         pass
     
+    @property
+    @abstractmethod
+    def script_timeout(self) -> int:
+        """Timeout in seconds for scripts run in the page."""
+        pass
+    
+    @property
+    @abstractmethod
+    def chrome_profile_dir(self) -> str:
+        """Chrome user data directory reused across runs (empty for a fresh profile)."""
+        pass
+    
+    @property
+    @abstractmethod
+    def chrome_binary(self) -> str:
+        """Chrome executable, e.g. chrome-headless-shell (empty for the installed Chrome)."""
+        pass
+    
     # Processing Settings
     @property
     @abstractmethod
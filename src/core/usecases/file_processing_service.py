@@ -4,11 +4,11 @@ File processing service use case.
 Handles PDF validation and metadata extraction from invoice files.
 """
 
-import io
 import re
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Optional, Tuple, Final
+from pathlib import Path
+from typing import Tuple, Final, Mapping
 
 import PyPDF2
 import pdfplumber
@@ -16,6 +16,33 @@ import pdfplumber
 from src.core.domain.invoice import Invoice
 from src.core.ports.logger import Logger
 
+# Common date patterns in Spanish invoices
+DATE_PATTERNS: Final[Tuple[re.Pattern[str], ...]] = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})',  # DD/MM/YYYY or DD-MM-YYYY
+        r'(\d{4})[\/\-](\d{1,2})[\/\-](\d{1,2})',  # YYYY/MM/DD or YYYY-MM-DD
+        r'(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})',  # DD de MMM de YYYY
+    )
+)
+
+# Amounts with euro symbols or "EUR"
+AMOUNT_PATTERNS: Final[Tuple[re.Pattern[str], ...]] = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(\d+[.,]\d{2})\s*€',  # 123,45 €
+        r'€\s*(\d+[.,]\d{2})',  # € 123,45
+        r'(\d+[.,]\d{2})\s*EUR',  # 123,45 EUR
+        r'(\d+[.,]\d{2})',  # Just numbers with comma/point
+    )
+)
+
+SPANISH_MONTHS: Final[Mapping[str, int]] = {
+    'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
+    'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
+    'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
+}
+
 
 class FileProcessingService:
     """Service for processing invoice files and extracting metadata."""
@@ -80,12 +107,8 @@ class FileProcessingService:
             ValueError: If the PDF cannot be processed or metadata cannot be extracted
         """
         try:
-            # Read the PDF file
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            
             # Extract text from PDF
-            text = self._extract_text_from_pdf_file(content)
+            text = self._extract_text_from_pdf_file(file_path)
             
             # Extract invoice date
             invoice_date = self._extract_invoice_date(text)
@@ -93,13 +116,7 @@ class FileProcessingService:
             # Extract cost amounts
             cost_euros, iva_euros = self._extract_amounts(text)
             
-            # Calculate file hashes
-            import hashlib
-            hash_md5 = hashlib.md5(content).hexdigest()
-            hash_sha256 = hashlib.sha256(content).hexdigest()
-            
             # Create invoice object
-            from pathlib import Path
             file_name = Path(file_path).name
             
             invoice = Invoice(
@@ -128,11 +145,11 @@ class FileProcessingService:
                             error=str(e))
             raise ValueError(f"Failed to extract metadata from PDF file: {e}")
     
-    def _extract_text_from_pdf_file(self, content: bytes) -> str:
-        """Extract text content from PDF bytes."""
+    def _extract_text_from_pdf_file(self, file_path: str) -> str:
+        """Extract text content from a PDF file path."""
         try:
             # Try with pdfplumber first (better for complex layouts)
-            with pdfplumber.open(io.BytesIO(content)) as pdf:
+            with pdfplumber.open(file_path) as pdf:
                 text = ""
                 for page in pdf.pages:
                     page_text = page.extract_text()
@@ -143,7 +160,7 @@ class FileProcessingService:
                     return text
             
             # Fallback to PyPDF2
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+            pdf_reader = PyPDF2.PdfReader(file_path)
             text = ""
             for page in pdf_reader.pages:
                 text += page.extract_text() + "\n"
@@ -182,19 +199,13 @@ class FileProcessingService:
     
     def _extract_invoice_date(self, text: str) -> datetime:
         """Extract invoice date from text."""
-        # Common date patterns in Spanish invoices
-        date_patterns = [
-            r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})',  # DD/MM/YYYY or DD-MM-YYYY
-            r'(\d{4})[\/\-](\d{1,2})[\/\-](\d{1,2})',  # YYYY/MM/DD or YYYY-MM-DD
-            r'(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})',  # DD de MMM de YYYY
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+        for pattern in DATE_PATTERNS:
+            # Only the first occurrence is used
+            match = pattern.search(text)
+            if match:
                 try:
-                    if len(matches[0]) == 3:
-                        day, month, year = matches[0]
+                    if len(match.groups()) == 3:
+                        day, month, year = match.groups()
                         
                         # Handle Spanish month names
                         if not month.isdigit():
@@ -208,17 +219,9 @@ class FileProcessingService:
     
     def _extract_amounts(self, text: str) -> Tuple[Decimal, Decimal]:
         """Extract cost and IVA amounts from text."""
-        # Look for amounts with euro symbols or "EUR"
-        amount_patterns = [
-            r'(\d+[.,]\d{2})\s*€',  # 123,45 €
-            r'€\s*(\d+[.,]\d{2})',  # € 123,45
-            r'(\d+[.,]\d{2})\s*EUR',  # 123,45 EUR
-            r'(\d+[.,]\d{2})',  # Just numbers with comma/point
-        ]
-        
         amounts = []
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in AMOUNT_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 try:
                     # Convert comma to point for decimal parsing
@@ -246,15 +249,9 @@ class FileProcessingService:
     
     def _spanish_month_to_number(self, month_name: str) -> int:
         """Convert Spanish month name to number."""
-        months = {
-            'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
-            'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
-            'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
-        }
-        
         month_lower = month_name.lower()
-        if month_lower in months:
-            return months[month_lower]
+        if month_lower in SPANISH_MONTHS:
+            return SPANISH_MONTHS[month_lower]
         
         raise ValueError(f"Unknown Spanish month: {month_name}")
     
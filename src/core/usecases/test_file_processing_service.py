@@ -0,0 +1,74 @@
+"""
+Unit tests for the file processing service text extraction.
+"""
+
+from decimal import Decimal
+import datetime
+import re
+
+import pytest
+
+from src.core.usecases.file_processing_service import FileProcessingService
+
+# Expected parsing errors
+MISSING_DATE_ERROR = re.compile("Could not extract invoice date")
+MISSING_AMOUNTS_ERROR = re.compile("Could not extract sufficient amounts")
+
+
+@pytest.fixture(scope="module")
+def service(logger):
+    """Create a FileProcessingService, shared by the module."""
+    return FileProcessingService(logger)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # The first date of the first matching pattern wins
+        (
+            "Fecha 28/10/2025, periodo 01/09/2025 - 30/09/2025",
+            datetime.datetime(2025, 10, 28),
+        ),
+        ("Emitida el 5-3-2024 y pagada el 20-3-2024", datetime.datetime(2024, 3, 5)),
+        # Numeric dates take precedence over spelled-out ones
+        ("15 de enero de 2024, vence 01/02/2024", datetime.datetime(2024, 2, 1)),
+        ("15 de Enero de 2024 y 1 de febrero de 2024", datetime.datetime(2024, 1, 15)),
+        # An invalid first match moves on to the next pattern, not the next match
+        ("31/02/2024, 01/03/2024 o 5 de marzo de 2024", datetime.datetime(2024, 3, 5)),
+    ],
+)
+def test_extract_invoice_date(service, text, expected):
+    """Test the first matching date is extracted."""
+    assert service._extract_invoice_date(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Sin fecha",
+        "31/02/2024 y 30/02/2024",
+    ],
+)
+def test_extract_invoice_date_missing(service, text):
+    """Test a text without a valid first date is rejected."""
+    with pytest.raises(ValueError, match=MISSING_DATE_ERROR):
+        service._extract_invoice_date(text)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # Every amount is scanned, the largest two are the total and the base
+        ("Base 100,00 Total 121,00 Otros 5,00", (Decimal("100.00"), Decimal("21.00"))),
+        ("Total 60.52 Base 50.02 IVA 10.50", (Decimal("50.02"), Decimal("10.50"))),
+    ],
+)
+def test_extract_amounts(service, text, expected):
+    """Test the base and IVA amounts are derived from all the amounts found."""
+    assert service._extract_amounts(text) == expected
+
+
+def test_extract_amounts_missing(service):
+    """Test a text with a single amount is rejected."""
+    with pytest.raises(ValueError, match=MISSING_AMOUNTS_ERROR):
+        service._extract_amounts("Total 60,52")